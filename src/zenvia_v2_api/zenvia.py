@@ -1,29 +1,473 @@
 """Class for comunication with Zenvia V2 API."""
 import requests
 import validators
-import simplejson as json
+import functools
+import copy
+import decimal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import ijson
+import os
+import sys
+from dataclasses import dataclass
+import threading
+import weakref
+from collections import OrderedDict
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 from zenvia_v2_api.exceptions import (
     ZenviaAPIException, ZenviaAPIRequestException,
     ZenviaAPIFunctionValidation)
-from typing import Any
+from typing import Any, Callable, Iterator, List, Union
+
+
+_EVENT_TYPES = frozenset({"MESSAGE", "MESSAGE_STATUS"})
+_STATUSES = frozenset({"ACTIVE", "DEGRADED", "INACTIVE"})
+_DIRECTIONS = frozenset({"IN", "OUT"})
+_CHANNELS = frozenset({"WHATSAPP", "SMS", "RCS", "EMAIL"})
+_TEMPLATE_STATUSES = frozenset({
+    "WAITING_REVIEW", "WAITING_APPROVAL", "APPROVED", "REJECTED",
+    "CANCELED", "PAUSED", "DISABLED"})
+# Domain of template_list query parameters, None if any value is accepted
+_TEMPLATE_PARAM_DOMAINS = {
+    "channel": _CHANNELS,
+    "status": _TEMPLATE_STATUSES,
+    "senderId": None,
+}
+
+# slots are only supported by dataclass from python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Webhooks are usually created for the same few urls, cache their validation
+_url_valid = functools.lru_cache(maxsize=256)(validators.url)
+
+# Calls hit a small fixed set of end-points, join them to host only once
+_endpoint_url = functools.lru_cache(maxsize=256)(urljoin)
+
+
+def _in_domain(value: Any, domain: frozenset) -> bool:
+    """
+    Check if value is one of the strings in domain.
+
+    Args:
+        value [Any]: Value to be checked, it may be unhashable.
+        domain [frozenset]: Accepted string values.
+    Return [bool]:
+        True if value is a string in domain.
+    """
+    return isinstance(value, str) and value in domain
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize types not supported by orjson as the previous json encoder.
+
+    Args:
+        obj [Any]: Object that orjson could not serialize.
+    Return [Any]:
+        Decimal as a raw json number, keeping all of its digits, and
+        namedtuple as a dictionary.
+    """
+    if isinstance(obj, decimal.Decimal) and obj.is_finite():
+        return orjson.Fragment(str(obj))
+    if isinstance(obj, tuple) and hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError(
+        "Type is not JSON serializable: {}".format(type(obj).__name__))
+
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize request body as json.
+
+    Non string dictionary keys are converted to strings, Decimal are sent
+    as numbers and namedtuple as objects, as simplejson did.
+
+    Args:
+        data [Any]: Data to be sent as json on request body.
+    Return [bytes]:
+        Data serialized as json.
+    Raise:
+        ZenviaAPIFunctionValidation: If data can not be serialized.
+    """
+    try:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as e:
+        raise ZenviaAPIFunctionValidation(
+            "data can not be serialized as json: {}".format(e)) from e
+
+
+def _parse_content(content: bytes) -> Any:
+    """
+    Parse json content of a response, empty content is returned as None.
+
+    Args:
+        content [bytes]: Content of a response.
+    Return [Any]:
+        Content on python native variables.
+    """
+    if not content:
+        return None
+    return orjson.loads(content)
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class WebhookSpec:
+    """
+    Validated specification of a webhook to be created.
+
+    Args:
+        Same arguments as ZenviaAPI.webhook_create.
+    Raise:
+        ZenviaAPIFunctionValidation: If arguments are not valid.
+    """
+
+    event_type: str
+    webhook_url: str
+    webhook_headers: dict
+    criteria_channel: str
+    criteria_direction: str = None
+    status: str = 'ACTIVE'
+
+    def __post_init__(self):
+        """Validate webhook arguments."""
+        if not _in_domain(self.event_type, _EVENT_TYPES):
+            raise ZenviaAPIFunctionValidation(
+                "event_type not in [MESSAGE, MESSAGE_STATUS]")
+
+        if self.status is not None:
+            if not _in_domain(self.status, _STATUSES):
+                raise ZenviaAPIFunctionValidation(
+                    "status not in [ACTIVE, DEGRADED, INACTIVE]")
+
+        if self.event_type == "MESSAGE":
+            if self.criteria_direction is None:
+                raise ZenviaAPIFunctionValidation(
+                    "event_type == MESSAGE and criteria_direction is None")
+            if not _in_domain(self.criteria_direction, _DIRECTIONS):
+                raise ZenviaAPIFunctionValidation(
+                    "criteria_direction not in [IN, OUT]")
+
+        if not _url_valid(self.webhook_url):
+            raise ZenviaAPIFunctionValidation(
+                "webhook_url is not a well formated url")
+
+    def to_payload(self) -> dict:
+        """
+        Build the request payload.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return [dict]:
+            Payload to be posted at "subscriptions" end-point.
+        """
+        data = {
+            "eventType": self.event_type,
+            "webhook": {
+                "url": self.webhook_url,
+                "headers": self.webhook_headers,
+            },
+            "status": self.status,
+            "version": "v2",
+            "criteria": {
+                "channel": self.criteria_channel,
+            }
+        }
+        if self.event_type == "MESSAGE":
+            data["criteria"]["direction"] = self.criteria_direction
+        return data
+
+
+def _whatsapp_text_data(msg_from: str, msg_to: str, text: str) -> dict:
+    """
+    Build the payload of a WhatsApp free text message.
+
+    Args:
+        Same arguments as ZenviaAPI.whatsapp_send_text.
+    Return [dict]:
+        Payload to be posted at "channels/whatsapp/messages" end-point,
+        contents are a tuple that is serialized as a json array.
+    """
+    return {
+        "from": msg_from,
+        "to": msg_to,
+        "contents": ({"type": "text", "text": text}, ),
+    }
+
+
+def _whatsapp_templated_data(msg_from: str, msg_to: str, template_id: str,
+                             fields: dict) -> dict:
+    """
+    Build the payload of a WhatsApp templated message.
+
+    Args:
+        Same arguments as ZenviaAPI.whatsapp_send_templated.
+    Return [dict]:
+        Payload to be posted at "channels/whatsapp/messages" end-point,
+        contents are a tuple that is serialized as a json array.
+    """
+    return {
+        "from": msg_from,
+        "to": msg_to,
+        "contents": ({
+            "type": "template", "templateId": template_id,
+            "fields": fields}, ),
+    }
+
+
+def _whatsapp_message_data(message: dict) -> dict:
+    """
+    Build the payload of a WhatsApp text or templated message.
+
+    Args:
+        message [dict]: Arguments of ZenviaAPI.whatsapp_send_text or
+            ZenviaAPI.whatsapp_send_templated.
+    Return [dict]:
+        Payload to be posted at "channels/whatsapp/messages" end-point.
+    """
+    if "text" in message:
+        return _whatsapp_text_data(**message)
+    if "template_id" in message:
+        return _whatsapp_templated_data(**message)
+    raise ZenviaAPIFunctionValidation(
+        "message must have text or template_id: {}".format(message))
+
+
+def _template_list_params(channel: str = None, status: str = None,
+                          sender_id: str = None) -> dict:
+    """
+    Validate template_list arguments and build the query parameters.
+
+    Args:
+        Same arguments as ZenviaAPI.template_list.
+    Return [dict]:
+        Parameters to be passed at "templates" end-point.
+    """
+    params = {
+        key: value for key, value in (
+            ("channel", channel), ("status", status),
+            ("senderId", sender_id))
+        if value is not None}
+    for key, value in params.items():
+        domain = _TEMPLATE_PARAM_DOMAINS[key]
+        if domain is not None and not _in_domain(value, domain):
+            raise ZenviaAPIFunctionValidation(
+                "{key} not in [{domain}]".format(
+                    key=key, domain=", ".join(sorted(domain))))
+    return params
+
+
+class _Pipeline:
+    """
+    Queue ZenviaAPI calls and send them concurrently at the end of with.
+
+    Arguments are validated when calls are queued. The outcome of each call
+    is available at results attribute in the same order calls were queued,
+    the response or the exception raised by the call, so a failed call does
+    not hide calls that were already sent. Queued calls are not sent if an
+    exception is raised inside the with statement. The queue is emptied at
+    the end of each with statement, so entering the same pipeline again
+    sends only the calls queued on it.
+    """
+
+    def __init__(self, api: "ZenviaAPI"):
+        """
+        __init__.
+
+        Args:
+            api [ZenviaAPI]: Object used to send the queued calls.
+        Return:
+            _Pipeline object.
+        """
+        self._api = api
+        self._calls = []
+        self.results = None
+
+    def __enter__(self):
+        """Return object to queue calls on with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Send queued calls concurrently at the end of with statement."""
+        calls, self._calls = self._calls, []
+        if exc_type is None:
+            self.results = self._api._run_concurrently(calls)
+
+    def _queue_post(self, endpoint: str, data: dict):
+        """Queue a post request at Zenvia v2 API."""
+        self._calls.append(functools.partial(
+            self._api.request_post, endpoint=endpoint, data=data))
+
+    def webhook_create(self, event_type: str, webhook_url: str,
+                       webhook_headers: dict, criteria_channel: str,
+                       criteria_direction: str = None,
+                       status: str = 'ACTIVE'):
+        """
+        Queue the creation of a webhook.
+
+        See ZenviaAPI.webhook_create.
+        """
+        data = WebhookSpec(
+            event_type=event_type, webhook_url=webhook_url,
+            webhook_headers=webhook_headers,
+            criteria_channel=criteria_channel,
+            criteria_direction=criteria_direction,
+            status=status).to_payload()
+        self._queue_post(endpoint="subscriptions", data=data)
+
+    def webhook_delete(self, id: int):
+        """
+        Queue the deletion of a webhook.
+
+        See ZenviaAPI.webhook_delete.
+        """
+        self._calls.append(functools.partial(
+            self._api.webhook_delete, id=int(id)))
+
+    def whatsapp_send_text(self, msg_from: str, msg_to: str, text: str):
+        """
+        Queue a WhatsApp message with free text.
+
+        See ZenviaAPI.whatsapp_send_text.
+        """
+        data = _whatsapp_text_data(
+            msg_from=msg_from, msg_to=msg_to, text=text)
+        self._queue_post(endpoint="channels/whatsapp/messages", data=data)
+
+    def whatsapp_send_templated(self, msg_from: str, msg_to: str,
+                                template_id: str, fields: dict):
+        """
+        Queue a WhatsApp templated message.
+
+        See ZenviaAPI.whatsapp_send_templated.
+        """
+        data = _whatsapp_templated_data(
+            msg_from=msg_from, msg_to=msg_to, template_id=template_id,
+            fields=fields)
+        self._queue_post(endpoint="channels/whatsapp/messages", data=data)
 
 
 class ZenviaAPI:
     """Class for comunication with Zenvia v2 API."""
 
     API_HOST = "https://api.zenvia.com/v2/"
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    # (connect, read) timeouts in seconds used if none is passed on calls
+    DEFAULT_TIMEOUT = (3.05, 30)
+    CONDITIONAL_CACHE_SIZE = 128
+    TEMPLATE_CACHE_SIZE = 128
 
     def __init__(self, token: str):
         """
         __init__.
 
+        A requests.Session is kept for each thread using the object so
+        keep-alive connections are reused across calls to Zenvia API. Bodies
+        of GET responses with ETag or Last-Modified headers are kept in
+        memory so repeated calls are made as conditional requests.
+
         Args:
             token [str]: Token for Zenvia API authentication calls.
         Return:
             ZenviaAPI object.
         """
         self._token = token
+        self._auth_header = {"X-API-Token": token}
+
+        self._local = threading.local()
+        # Weak references, so sessions of finished threads are released
+        self._sessions = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+
+        self._conditional_cache = OrderedDict()
+        self._conditional_cache_lock = threading.Lock()
+        self._template_retrieve_cached = functools.lru_cache(
+            maxsize=self.TEMPLATE_CACHE_SIZE)(self._template_retrieve)
+
+    def __reduce__(self):
+        """Pickle only the token, sessions and caches are rebuilt."""
+        return (self.__class__, (self._token, ))
+
+    def __enter__(self):
+        """Return object to be used on with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close sessions at the end of with statement."""
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Return the session of the current thread, creating it if needed.
+
+        Sessions are not shared across threads nor with forked processes,
+        a process forked after a session was created builds a new one.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None or self._local.pid != os.getpid():
+            session = self._build_session()
+            self._local.session = session
+            self._local.pid = os.getpid()
+        return session
+
+    def _build_session(self) -> requests.Session:
+        """
+        Build a session with authentication and pooled connections.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return [requests.Session]:
+            Session with auth header and HTTPAdapter mounted.
+        """
+        session = requests.Session()
+        session.headers.update(self._auth_header)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3, connect=3, read=2, backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # POST is not retried on error status so messages and
+                # webhooks are not created twice
+                allowed_methods=frozenset({"GET", "DELETE"})))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with self._sessions_lock:
+            self._sessions.add(session)
+        return session
+
+    def close(self):
+        """
+        Close the sessions of all threads and their pooled connections.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return:
+            None.
+        """
+        with self._sessions_lock:
+            executor, self._executor = self._executor, None
+            executor_pid, self._executor_pid = self._executor_pid, None
+            sessions = list(self._sessions)
+            self._sessions = weakref.WeakSet()
+        # Worker threads of an executor inherited by fork do not exist
+        if executor is not None and executor_pid == os.getpid():
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
 
     def get_auth_header(self) -> dict:
         """
@@ -36,9 +480,7 @@ class ZenviaAPI:
         Return [dict]:
             Return a dictionary with "X-API-Token" key.
         """
-        return {
-            "X-API-Token": self._token
-        }
+        return dict(self._auth_header)
 
     def request_get(self, endpoint: str, params: dict = {}, **kwargs) -> Any:
         """
@@ -53,17 +495,97 @@ class ZenviaAPI:
         Return [Any]:
             Request return on python native variables.
         """
-        url = urljoin(self.API_HOST, endpoint)
-        auth_header = self.get_auth_header()
+        url = _endpoint_url(self.API_HOST, endpoint)
+        params = params or {}
+        # Encode params as requests does, so any accepted form is a valid key
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, params)
+        cache_key = prepared.url
+        with self._conditional_cache_lock:
+            cached = self._conditional_cache.get(cache_key)
+
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        headers.update(kwargs.pop("headers", {}))
+
         try:
-            response = requests.get(
-                url, headers=auth_header, params=params,
-                **kwargs)
+            kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+            response = self.session.get(
+                url, params=params, headers=headers, **kwargs)
             response.raise_for_status()
         except Exception as e:
             raise ZenviaAPIRequestException(str(e))
 
-        return response.json()
+        if response.status_code == 304 and cached is not None:
+            return _parse_content(cached[2])
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            self._conditional_cache_set(
+                cache_key, (etag, last_modified, response.content))
+        return _parse_content(response.content)
+
+    def _conditional_cache_set(self, key: str, entry: tuple):
+        """
+        Keep a GET response for conditional requests, dropping the oldest.
+
+        Args:
+            key [str]: Url with encoded parameters of the request.
+            entry [tuple]: ETag, Last-Modified and content of the response.
+        Return:
+            None.
+        """
+        with self._conditional_cache_lock:
+            self._conditional_cache[key] = entry
+            self._conditional_cache.move_to_end(key)
+            if len(self._conditional_cache) > self.CONDITIONAL_CACHE_SIZE:
+                self._conditional_cache.popitem(last=False)
+
+    def request_get_iter(self, endpoint: str, params: dict = {},
+                         **kwargs) -> Iterator[Any]:
+        """
+        Make get request at Zenvia v2 API streaming a list response.
+
+        Items are parsed while the response is read, so memory is bounded
+        by one item and not by the whole list.
+
+        Args:
+            endpoint [str]: End-point for Zenvia API.
+            params [dict]: Get parameters passed to request.get function.
+        Kwargs:
+            **kwargs: Extra arguments passed to request.get function.
+        Return [Iterator[Any]]:
+            Items of the returned list on python native variables.
+        """
+        url = _endpoint_url(self.API_HOST, endpoint)
+        try:
+            kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+            response = self.session.get(
+                url, params=params, stream=True, **kwargs)
+        except Exception as e:
+            raise ZenviaAPIRequestException(str(e))
+
+        # Streamed response must be closed to release its connection even
+        # if it has an error status
+        with response:
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                raise ZenviaAPIRequestException(str(e))
+
+            # Let urllib3 decompress gzip/br content before parsing
+            response.raw.decode_content = True
+            try:
+                yield from ijson.items(response.raw, "item", use_float=True)
+            except Exception as e:
+                # Errors reading raw response are not translated by requests
+                raise ZenviaAPIRequestException(str(e)) from e
 
     def request_post(self, endpoint: str, params: dict = {}, data: dict = {},
                      **kwargs) -> Any:
@@ -79,24 +601,22 @@ class ZenviaAPI:
         Return [Any]:
             Request return on python native variables.
         """
-        url = urljoin(self.API_HOST, endpoint)
-        auth_header = self.get_auth_header()
+        url = _endpoint_url(self.API_HOST, endpoint)
+        body = _dumps(data)
         try:
-            response = requests.post(
-                url, headers=auth_header, params=params, json=data,
-                **kwargs)
+            headers = {"Content-Type": "application/json"}
+            headers.update(kwargs.pop("headers", {}))
+            kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+            response = self.session.post(
+                url, params=params, data=body, headers=headers, **kwargs)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise ZenviaAPIRequestException("{error}: {text}".format(
+                error=e, text=e.response.text[:500])) from e
         except Exception as e:
             raise ZenviaAPIRequestException(str(e))
 
-        if not response.ok:
-            msg = (
-                "Request reponse with error status[{status}]:\n{text}"
-            ).format(
-                status=response.status_code,
-                text=json.dumps(response.json(), indent=2))
-            raise ZenviaAPIRequestException(msg)
-
-        return response.json()
+        return _parse_content(response.content)
 
     def request_delete(self, endpoint: str, params: dict = {},
                        **kwargs) -> Any:
@@ -112,17 +632,72 @@ class ZenviaAPI:
         Return [Any]:
             Request return on python native variables.
         """
-        url = urljoin(self.API_HOST, endpoint)
-        auth_header = self.get_auth_header()
+        url = _endpoint_url(self.API_HOST, endpoint)
         try:
-            response = requests.delete(
-                url, headers=auth_header, params=params,
-                **kwargs)
+            kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+            response = self.session.delete(
+                url, params=params, **kwargs)
             response.raise_for_status()
         except Exception as e:
             raise ZenviaAPIRequestException(str(e))
 
-        return response.json()
+        return _parse_content(response.content)
+
+    def pipeline(self) -> _Pipeline:
+        """
+        Return a context manager that queues calls and sends them on exit.
+
+        Queued calls are sent concurrently at the end of the with statement
+        by the client worker threads, each one with its own session. The
+        outcome of each call, the response or the exception raised, is
+        kept at results attribute.
+
+        Example:
+            with zenvia_api.pipeline() as pipeline:
+                pipeline.webhook_create(...)
+                pipeline.whatsapp_send_text(...)
+            print(pipeline.results)
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return [_Pipeline]:
+            Object with webhook_create, webhook_delete, whatsapp_send_text
+            and whatsapp_send_templated methods that queue the calls.
+        """
+        return _Pipeline(self)
+
+    def _run_concurrently(self, calls: List[Callable]) -> list:
+        """
+        Run calls concurrently using a thread pool kept on the object.
+
+        Worker threads live as long as the object, so each keeps its session
+        and pooled connections across calls. A process forked after the pool
+        was created builds a new one, worker threads are not copied by fork.
+
+        Args:
+            calls [List[Callable]]: Functions without arguments that will
+                be called concurrently.
+        Return [list]:
+            Outcome of each call in the same order they were passed, the
+            returned value or the exception raised by the call. A failed call
+            does not hide the results of the calls that were already sent.
+        """
+        if len(calls) == 0:
+            return []
+        with self._sessions_lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.POOL_MAXSIZE)
+                self._executor_pid = os.getpid()
+            executor = self._executor
+        futures = [executor.submit(call) for call in calls]
+        outcomes = []
+        for future in futures:
+            error = future.exception()
+            outcomes.append(future.result() if error is None else error)
+        return outcomes
 
     def webhook_list(self, **kwargs) -> list:
         """
@@ -158,6 +733,19 @@ class ZenviaAPI:
         """
         return self.request_get(endpoint="subscriptions", **kwargs)
 
+    def webhook_list_iter(self, **kwargs) -> Iterator[dict]:
+        """
+        Iterate over all avaiable webhooks streaming the response.
+
+        Args:
+            No Args.
+        Kwargs:
+            **kwargs: Extra arguments passed to request.get function.
+        Return [Iterator[dict]]:
+            Registred webhooks, see webhook_list.
+        """
+        return self.request_get_iter(endpoint="subscriptions", **kwargs)
+
     def webhook_retrieve(self, id: int, **kwargs) -> dict:
         """
         Retrieve one webhook using its id.
@@ -190,7 +778,7 @@ class ZenviaAPI:
                 }
             }
         """
-        endpoint = "subscriptions/{}".format(int(id))
+        endpoint = f"subscriptions/{int(id)}"
         return self.request_get(endpoint=endpoint, **kwargs)
 
     def webhook_delete(self, id: int, **kwargs) -> list:
@@ -225,7 +813,7 @@ class ZenviaAPI:
                 }
             }
         """
-        endpoint = "subscriptions/{}".format(int(id))
+        endpoint = f"subscriptions/{int(id)}"
         return self.request_delete(endpoint=endpoint, **kwargs)
 
     def webhook_create(self, event_type: str, webhook_url: str,
@@ -257,61 +845,139 @@ class ZenviaAPI:
                 be set as "IN" or "OUT", Indicates whether is received from a
                 channel (IN) or sent to a channel (OUT).
         """
-        # Validation of function parameters
-        if event_type not in ["MESSAGE", "MESSAGE_STATUS"]:
-            raise ZenviaAPIFunctionValidation(
-                "event_type not in [MESSAGE, MESSAGE_STATUS]")
+        data = WebhookSpec(
+            event_type=event_type, webhook_url=webhook_url,
+            webhook_headers=webhook_headers,
+            criteria_channel=criteria_channel,
+            criteria_direction=criteria_direction,
+            status=status).to_payload()
+        return self.request_post(endpoint="subscriptions", data=data)
 
-        if status is not None:
-            if status not in ["ACTIVE", "DEGRADED", "INACTIVE"]:
-                raise ZenviaAPIFunctionValidation(
-                    "status not in [ACTIVE, DEGRADED, INACTIVE]")
+    def webhooks_create_many(
+            self, specs: List[Union[dict, "WebhookSpec"]]) -> list:
+        """
+        Create many webhooks concurrently.
 
-        if event_type == "MESSAGE":
-            if criteria_direction is None:
-                raise ZenviaAPIFunctionValidation(
-                    "event_type == MESSAGE and criteria_direction is None")
-            if criteria_direction not in ["IN", "OUT"]:
-                raise ZenviaAPIFunctionValidation(
-                    "criteria_direction not in [IN, OUT]")
+        Zenvia API does not have a bulk end-point for subscriptions, all
+        specs are validated before any request is made and then posted
+        concurrently by the client worker threads.
 
-        val_webhook_url = validators.url(webhook_url)
-        if not val_webhook_url:
-            raise ZenviaAPIFunctionValidation(
-                "webhook_url is not a well formated url")
+        Args:
+            specs [List[Union[dict, WebhookSpec]]]: List of WebhookSpec or
+                dictionaries with webhook_create arguments.
+        Return [list]:
+            Zenvia API responses in the same order of specs. Specs that
+            failed to be created have the exception raised by the call in
+            place of the response, so the webhooks that were created can
+            still be retrieved from the list.
+        """
+        all_data = [
+            (spec if isinstance(spec, WebhookSpec)
+             else WebhookSpec(**spec)).to_payload()
+            for spec in specs]
+        return self._run_concurrently([
+            (lambda data=data: self.request_post(
+                endpoint="subscriptions", data=data))
+            for data in all_data])
 
-        data = {}
-        if event_type == "MESSAGE":
-            data = {
-                "eventType": "MESSAGE",
-                "webhook": {
-                    "url": webhook_url,
-                    "headers": webhook_headers,
-                },
-                "status": status,
-                "version": "v2",
-                "criteria": {
-                    "channel": criteria_channel,
-                    "direction": criteria_direction
-                }
-            }
-        elif event_type == "MESSAGE_STATUS":
-            data = {
-                "eventType": "MESSAGE_STATUS",
-                "webhook": {
-                    "url": webhook_url,
-                    "headers": webhook_headers,
-                },
-                "status": status,
-                "version": "v2",
-                "criteria": {
-                    "channel": criteria_channel,
-                }
+    def template_list(self, channel: str = None, status: str = None,
+                      sender_id: str = None, **kwargs) -> list:
+        """
+        List templates, optionally filtered.
+
+        Zenvia API Doc:
+        https://zenvia.github.io/zenvia-openapi-spec/v2/#tag/Templates/paths/~1templates/get
+
+        Args:
+            No Args.
+        Kwargs:
+            channel [str]: Filter templates by channel, must be in
+                ["WHATSAPP", "SMS", "RCS", "EMAIL"].
+            status [str]: Filter templates by status, must be in
+                ["WAITING_REVIEW", "WAITING_APPROVAL", "APPROVED",
+                "REJECTED", "CANCELED", "PAUSED", "DISABLED"].
+            sender_id [str]: Filter templates by sender id.
+            **kwargs: Extra arguments passed to request.get function.
+        Return [list]:
+            List of dictionary with templates, see template_retrieve.
+        """
+        params = _template_list_params(
+            channel=channel, status=status, sender_id=sender_id)
+        return self.request_get(
+            endpoint="templates", params=params, **kwargs)
+
+    def template_list_iter(self, channel: str = None, status: str = None,
+                           sender_id: str = None,
+                           **kwargs) -> Iterator[dict]:
+        """
+        Iterate over templates streaming the response.
+
+        Args:
+            No Args.
+        Kwargs:
+            Same arguments as template_list.
+        Return [Iterator[dict]]:
+            Templates, see template_retrieve.
+        """
+        params = _template_list_params(
+            channel=channel, status=status, sender_id=sender_id)
+        return self.request_get_iter(
+            endpoint="templates", params=params, **kwargs)
+
+    def template_retrieve(self, id: str, **kwargs) -> dict:
+        """
+        Retrieve one template using its id.
+
+        Templates are cached on the object by id, use template_cache_clear
+        to invalidate it after templates are edited. Calls with extra
+        arguments are not cached.
+
+        Zenvia API Doc:
+        https://zenvia.github.io/zenvia-openapi-spec/v2/#tag/Templates/paths/~1templates~1%7BtemplateId%7D/get
+
+        Args:
+            id [str]: Id of the template to be retrieved.
+        Kwargs:
+            **kwargs: Extra arguments passed to request.get function.
+        Return [dict]:
+            A dictionary with the template with id passed as argument.
+
+            Example:
+            {
+                "id": "string",
+                "name": "string",
+                "locale": "pt_BR",
+                "channel": "WHATSAPP",
+                "category": "string",
+                "senderId": "string",
+                "components": { },
+                "fields": ["string"],
+                "status": "APPROVED",
+                "createdAt": "string",
+                "updatedAt": "string"
             }
-        else:
-            raise ZenviaAPIFunctionValidation(
-                "event_type not avaiable: {}".format(event_type))
-        return self.request_post(endpoint="subscriptions", data=data)
+        """
+        if kwargs:
+            return self._template_retrieve(id, **kwargs)
+        return copy.deepcopy(self._template_retrieve_cached(id))
+
+    def _template_retrieve(self, id: str, **kwargs) -> dict:
+        """Retrieve one template from Zenvia API without cache."""
+        endpoint = f"templates/{id}"
+        return self.request_get(endpoint=endpoint, **kwargs)
+
+    def template_cache_clear(self):
+        """
+        Clear templates cached by template_retrieve.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return:
+            None.
+        """
+        self._template_retrieve_cached.cache_clear()
 
     def whatsapp_send_text(self, msg_from: str, msg_to: str, text: str):
         """
@@ -334,16 +1000,8 @@ class ZenviaAPI:
                 a URL preview will be added to the message, if the channel
                 supports it.
         """
-        data = {
-            "from": msg_from,
-            "to": msg_to,
-            "contents": [
-                {
-                    "type": "text",
-                    "text": text
-                }
-            ]
-        }
+        data = _whatsapp_text_data(
+            msg_from=msg_from, msg_to=msg_to, text=text)
         return self.request_post(
             endpoint="channels/whatsapp/messages",
             data=data)
@@ -371,17 +1029,32 @@ class ZenviaAPI:
                 the template page.
             fields [dict]: The available fields to be used in this template.
         """
-        data = {
-            "from": msg_from,
-            "to": msg_to,
-            "contents": [
-                {
-                    "type": "template",
-                    "templateId": template_id,
-                    "fields": fields
-                }
-            ]
-        }
+        data = _whatsapp_templated_data(
+            msg_from=msg_from, msg_to=msg_to, template_id=template_id,
+            fields=fields)
         return self.request_post(
             endpoint="channels/whatsapp/messages",
             data=data)
+
+    def whatsapp_send_bulk(self, messages: List[dict]) -> list:
+        """
+        Send many WhatsApp messages concurrently.
+
+        All payloads are built before any request is made and then posted
+        concurrently by the client worker threads.
+
+        Args:
+            messages [List[dict]]: List of dictionaries with
+                whatsapp_send_text arguments (msg_from, msg_to, text) or
+                whatsapp_send_templated arguments (msg_from, msg_to,
+                template_id, fields).
+        Return [list]:
+            Zenvia API responses in the same order of messages. Messages
+            that failed to be sent have the exception raised by the call in
+            place of the response, so only those must be sent again.
+        """
+        all_data = [_whatsapp_message_data(message) for message in messages]
+        return self._run_concurrently([
+            (lambda data=data: self.request_post(
+                endpoint="channels/whatsapp/messages", data=data))
+            for data in all_data])
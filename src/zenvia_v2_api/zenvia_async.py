@@ -0,0 +1,246 @@
+"""Asyncio class for comunication with Zenvia V2 API."""
+import httpx
+from zenvia_v2_api.zenvia import (
+    WebhookSpec, _dumps, _parse_content, _template_list_params,
+    _whatsapp_text_data, _whatsapp_templated_data)
+from zenvia_v2_api.exceptions import ZenviaAPIRequestException
+from typing import Any
+
+
+class ZenviaAPIAsync:
+    """
+    Asyncio class for comunication with Zenvia v2 API.
+
+    It provides ZenviaAPI request, webhook, template and WhatsApp send
+    methods as coroutines, so independent calls can be awaited together with
+    asyncio.gather. Requests are multiplexed over HTTP/2 connections to
+    Zenvia API host, sharing the same connection.
+
+    Bulk, pipeline and streaming (*_iter) methods and the template cache
+    are only available on ZenviaAPI, asyncio.gather covers concurrent calls.
+    """
+
+    API_HOST = "https://api.zenvia.com/v2/"
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 50
+    TIMEOUT = 10.0
+
+    def __init__(self, token: str):
+        """
+        __init__.
+
+        Args:
+            token [str]: Token for Zenvia API authentication calls.
+        Return:
+            ZenviaAPIAsync object.
+        """
+        self._token = token
+        self._auth_header = {"X-API-Token": token}
+
+        self._client = httpx.AsyncClient(
+            base_url=self.API_HOST,
+            headers=self._auth_header,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=self.MAX_CONNECTIONS),
+            timeout=httpx.Timeout(self.TIMEOUT))
+
+    async def __aenter__(self):
+        """Return object to be used on async with statement."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close client at the end of async with statement."""
+        await self.close()
+
+    async def close(self):
+        """
+        Close the client and its pooled connections.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return:
+            None.
+        """
+        await self._client.aclose()
+
+    def get_auth_header(self) -> dict:
+        """
+        Return header dictionary with authentication.
+
+        Args:
+            No Args.
+        Kwargs:
+            No Kwargs.
+        Return [dict]:
+            Return a dictionary with "X-API-Token" key.
+        """
+        return dict(self._auth_header)
+
+    async def request_get(self, endpoint: str, params: dict = {},
+                          **kwargs) -> Any:
+        """
+        Make get request at Zenvia v2 API.
+
+        Args:
+            endpoint [str]: End-point for Zenvia API.
+            params [dict]: Get parameters passed to request function.
+        Kwargs:
+            **kwargs: Extra arguments passed to httpx request function.
+        Return [Any]:
+            Request return on python native variables.
+        """
+        try:
+            response = await self._client.request(
+                "GET", endpoint, params=params, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            raise ZenviaAPIRequestException(str(e))
+
+        return _parse_content(response.content)
+
+    async def request_post(self, endpoint: str, params: dict = {},
+                           data: dict = {}, **kwargs) -> Any:
+        """
+        Make post request at Zenvia v2 API.
+
+        Args:
+            endpoint [str]: End-point for Zenvia API.
+            params [dict]: Get parameters passed to request function.
+            data [dict]: Data to be sent as json on request body.
+        Kwargs:
+            **kwargs: Extra arguments passed to httpx request function.
+        Return [Any]:
+            Request return on python native variables.
+        """
+        body = _dumps(data)
+        try:
+            headers = {"Content-Type": "application/json"}
+            headers.update(kwargs.pop("headers", {}))
+            response = await self._client.request(
+                "POST", endpoint, params=params, content=body,
+                headers=headers, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ZenviaAPIRequestException("{error}: {text}".format(
+                error=e, text=e.response.text[:500])) from e
+        except Exception as e:
+            raise ZenviaAPIRequestException(str(e))
+
+        return _parse_content(response.content)
+
+    async def request_delete(self, endpoint: str, params: dict = {},
+                             **kwargs) -> Any:
+        """
+        Make delete request at Zenvia v2 API.
+
+        Args:
+            endpoint [str]: End-point for Zenvia API.
+            params [dict]: Get parameters passed to request function.
+        Kwargs:
+            **kwargs: Extra arguments passed to httpx request function.
+        Return [Any]:
+            Request return on python native variables.
+        """
+        try:
+            response = await self._client.request(
+                "DELETE", endpoint, params=params, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            raise ZenviaAPIRequestException(str(e))
+
+        return _parse_content(response.content)
+
+    async def webhook_list(self, **kwargs) -> list:
+        """
+        List all avaiable webhooks.
+
+        See ZenviaAPI.webhook_list.
+        """
+        return await self.request_get(endpoint="subscriptions", **kwargs)
+
+    async def webhook_retrieve(self, id: int, **kwargs) -> dict:
+        """
+        Retrieve one webhook using its id.
+
+        See ZenviaAPI.webhook_retrieve.
+        """
+        endpoint = f"subscriptions/{int(id)}"
+        return await self.request_get(endpoint=endpoint, **kwargs)
+
+    async def webhook_delete(self, id: int, **kwargs) -> list:
+        """
+        Delete one webhook using its id.
+
+        See ZenviaAPI.webhook_delete.
+        """
+        endpoint = f"subscriptions/{int(id)}"
+        return await self.request_delete(endpoint=endpoint, **kwargs)
+
+    async def webhook_create(self, event_type: str, webhook_url: str,
+                             webhook_headers: dict, criteria_channel: str,
+                             criteria_direction: str = None,
+                             status: str = 'ACTIVE'):
+        """
+        Create a webhook.
+
+        See ZenviaAPI.webhook_create.
+        """
+        data = WebhookSpec(
+            event_type=event_type, webhook_url=webhook_url,
+            webhook_headers=webhook_headers,
+            criteria_channel=criteria_channel,
+            criteria_direction=criteria_direction,
+            status=status).to_payload()
+        return await self.request_post(endpoint="subscriptions", data=data)
+
+    async def template_list(self, channel: str = None, status: str = None,
+                            sender_id: str = None, **kwargs) -> list:
+        """
+        List templates, optionally filtered.
+
+        See ZenviaAPI.template_list.
+        """
+        params = _template_list_params(
+            channel=channel, status=status, sender_id=sender_id)
+        return await self.request_get(
+            endpoint="templates", params=params, **kwargs)
+
+    async def template_retrieve(self, id: str, **kwargs) -> dict:
+        """
+        Retrieve one template using its id.
+
+        See ZenviaAPI.template_retrieve, results are not cached.
+        """
+        endpoint = f"templates/{id}"
+        return await self.request_get(endpoint=endpoint, **kwargs)
+
+    async def whatsapp_send_text(self, msg_from: str, msg_to: str,
+                                 text: str):
+        """
+        Send a WhatsApp message with free text.
+
+        See ZenviaAPI.whatsapp_send_text.
+        """
+        data = _whatsapp_text_data(
+            msg_from=msg_from, msg_to=msg_to, text=text)
+        return await self.request_post(
+            endpoint="channels/whatsapp/messages",
+            data=data)
+
+    async def whatsapp_send_templated(self, msg_from: str, msg_to: str,
+                                      template_id: str, fields: dict):
+        """
+        Send a templated message to recipient.
+
+        See ZenviaAPI.whatsapp_send_templated.
+        """
+        data = _whatsapp_templated_data(
+            msg_from=msg_from, msg_to=msg_to, template_id=template_id,
+            fields=fields)
+        return await self.request_post(
+            endpoint="channels/whatsapp/messages",
+            data=data)
@@ -0,0 +1,178 @@
+"""Tests for ZenviaAPI class."""
+import os
+import decimal
+import collections
+import time
+import signal
+import functools
+import threading
+import http.server
+import pytest
+from unittest import mock
+from requests.adapters import HTTPAdapter
+from zenvia_v2_api import zenvia
+from zenvia_v2_api.zenvia import ZenviaAPI, WebhookSpec, _dumps
+from zenvia_v2_api.exceptions import (
+    ZenviaAPIFunctionValidation, ZenviaAPIRequestException)
+
+
+MESSAGES = [
+    {"msg_from": "soft-harbor", "msg_to": "0000000000000", "text": "1"},
+    {"msg_from": "soft-harbor", "msg_to": "0000000000001", "text": "2"},
+]
+
+
+def _post_response(*args, **kwargs):
+    return mock.Mock(content=b'{"id": "message-id"}')
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Answer every GET with status and body set on the class."""
+
+    protocol_version = "HTTP/1.1"
+    status = 200
+    body = b"[]"
+    content_length = None
+
+    def do_GET(self):
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header(
+            "Content-Length", str(self.content_length or len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+        if self.content_length is not None:
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_api():
+    """Return a function building ZenviaAPI bound to a local server."""
+    servers = []
+
+    def build(pool_maxsize: int = 2, **handler_attrs):
+        handler = type("Handler", (_Handler, ), handler_attrs)
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+        class LocalZenviaAPI(ZenviaAPI):
+            API_HOST = "http://127.0.0.1:{}/".format(server.server_address[1])
+            POOL_MAXSIZE = pool_maxsize
+        return LocalZenviaAPI(token="token")
+
+    yield build
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork not available")
+def test_bulk_send_after_fork():
+    """Bulk send in a forked child must not use parent worker threads."""
+    with mock.patch("requests.Session.post", side_effect=_post_response):
+        zenvia_api = ZenviaAPI(token="token")
+        # Leave idle worker threads on the parent pool, a forked pool would
+        # reuse them instead of starting new ones
+        for i in range(10):
+            assert zenvia_api.whatsapp_send_bulk(MESSAGES) == [
+                {"id": "message-id"}, {"id": "message-id"}]
+        time.sleep(0.1)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                results = zenvia_api.whatsapp_send_bulk(MESSAGES)
+                os._exit(0 if len(results) == len(MESSAGES) else 1)
+            except BaseException:
+                os._exit(1)
+
+        deadline = time.monotonic() + 10
+        while True:
+            finished_pid, status = os.waitpid(pid, os.WNOHANG)
+            if finished_pid != 0:
+                break
+            if time.monotonic() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                pytest.fail("bulk send hung on forked child")
+            time.sleep(0.05)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        zenvia_api.close()
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"event_type": ["MESSAGE"]},
+    {"event_type": "MESSAGE", "criteria_direction": ["IN"]},
+    {"event_type": "MESSAGE_STATUS", "status": {"ACTIVE": 1}},
+])
+def test_webhook_spec_unhashable_values(kwargs):
+    """Unhashable values must raise validation exception."""
+    with pytest.raises(ZenviaAPIFunctionValidation):
+        WebhookSpec(
+            webhook_url="https://example.com/webhook", webhook_headers={},
+            criteria_channel="WhatsApp", **kwargs)
+
+
+def test_template_list_unhashable_values():
+    """Unhashable filters must raise validation exception."""
+    with pytest.raises(ZenviaAPIFunctionValidation):
+        ZenviaAPI(token="token").template_list(channel=["SMS"])
+
+
+def test_dumps_simplejson_compatible():
+    """Request bodies accepted by simplejson must still be serialized."""
+    Price = collections.namedtuple("Price", ["value", "currency"])
+    data = {"fields": {
+        1: "x", "price": Price(decimal.Decimal("9.90"), "BRL")}}
+    assert _dumps(data) == (
+        b'{"fields":{"1":"x","price":{"value":9.90,"currency":"BRL"}}}')
+
+
+def test_stream_error_status_releases_connection(local_api):
+    """Error responses of streamed GETs must return their connection."""
+    blocking_adapter = functools.partial(HTTPAdapter, pool_block=True)
+    with mock.patch.object(zenvia, "HTTPAdapter", blocking_adapter):
+        zenvia_api = local_api(pool_maxsize=2, status=404, body=b"{}")
+        errors = []
+
+        def list_webhooks():
+            for i in range(4):
+                try:
+                    list(zenvia_api.webhook_list_iter())
+                except ZenviaAPIRequestException as e:
+                    errors.append(e)
+
+        thread = threading.Thread(target=list_webhooks, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive(), "connection pool exhausted"
+        assert len(errors) == 4
+
+
+def test_stream_truncated_body(local_api):
+    """Errors while reading streamed body raise ZenviaAPIRequestException."""
+    zenvia_api = local_api(
+        body=b'[{"id": "1"}, {"id": "2"}, {"id"', content_length=1000)
+    with pytest.raises(ZenviaAPIRequestException):
+        list(zenvia_api.webhook_list_iter())
+
+
+def test_pipeline_reentered_sends_only_new_calls():
+    """Entering a pipeline again must not send previous calls again."""
+    with mock.patch(
+            "requests.Session.post", side_effect=_post_response) as post:
+        zenvia_api = ZenviaAPI(token="token")
+        pipeline = zenvia_api.pipeline()
+        with pipeline:
+            pipeline.whatsapp_send_text(**MESSAGES[0])
+        assert len(pipeline.results) == 1
+
+        with pipeline:
+            pipeline.whatsapp_send_text(**MESSAGES[1])
+        assert len(pipeline.results) == 1
+        assert post.call_count == 2
+        zenvia_api.close()